@@ -2,16 +2,19 @@
 
 import logging
 import sys
-import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from .config import SignageConfig
-from .media_manager import MediaManager
-from .player import MPVController
-from .scheduler import SignageScheduler
-from .setup_manager import SetupManager
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime so fast commands don't pay for mpv/watchdog imports
+    from .media_manager import MediaManager
+    from .player import MPVController
+    from .scheduler import SignageScheduler
+    from .setup_manager import SetupManager
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +25,35 @@ class SignageCLI:
     def __init__(self, config: SignageConfig) -> None:
         """Initialize CLI controller."""
         self.config = config
-        self.setup_manager = SetupManager(config)
+        self._setup_manager: SetupManager | None = None
         self.media_manager: MediaManager | None = None
         self.player: MPVController | None = None
         self.scheduler: SignageScheduler | None = None
         self.running = False
 
-    def initialize(self) -> bool:
-        """Initialize the signage system components.
+    @property
+    def setup_manager(self) -> "SetupManager":
+        """Setup manager, created on first use."""
+        if self._setup_manager is None:
+            from .setup_manager import SetupManager
+
+            self._setup_manager = SetupManager(self.config)
+        return self._setup_manager
+
+    def initialize_media(self) -> bool:
+        """Initialize the environment and media manager, without player or scheduler.
+
+        Enough for commands that only look at or change the media directory. Does nothing
+        if the media manager already exists.
 
         Returns:
             True if initialization successful.
         """
+        if self.media_manager is not None:
+            return True
+
+        from .media_manager import MediaManager
+
         # Prepare environment (logging, validation, requirements)
         if not self.setup_manager.prepare_environment():
             return False
@@ -43,6 +63,26 @@ class SignageCLI:
             media_directory=self.config.media_directory,
             default_image_duration=self.config.default_image_duration,
         )
+        self.media_manager.refresh_playlist()
+
+        return True
+
+    def initialize(self) -> bool:
+        """Initialize the signage system components.
+
+        Does nothing if the system is already initialized.
+
+        Returns:
+            True if initialization successful.
+        """
+        if self.scheduler is not None:
+            return True
+
+        if not self.initialize_media() or self.media_manager is None:
+            return False
+
+        from .player import MPVController
+        from .scheduler import SignageScheduler
 
         # Initialize player
         self.player = MPVController(
@@ -93,13 +133,21 @@ class SignageCLI:
 
     def get_status(self) -> dict:
         """Get current system status."""
-        if not self.scheduler:
-            return {"status": "not_initialized"}
+        if self.scheduler:
+            return {
+                "status": "running" if self.running else "stopped",
+                **self.scheduler.get_status(),
+            }
 
-        return {
-            "status": "running" if self.running else "stopped",
-            **self.scheduler.get_status(),
-        }
+        if self.media_manager:
+            return {
+                "status": "stopped",
+                "running": False,
+                "player_active": False,
+                **self.media_manager.get_playlist_info(),
+            }
+
+        return {"status": "not_initialized"}
 
     def next_media(self) -> bool:
         """Skip to next media."""
@@ -127,8 +175,8 @@ class SignageCLI:
 
     def refresh_playlist(self) -> None:
         """Refresh the media playlist."""
-        if self.scheduler:
-            self.scheduler.refresh_playlist()
+        if self.media_manager:
+            self.media_manager.refresh_playlist()
             logger.info("Playlist refreshed")
 
     def add_media_file(self, source_path: str) -> bool:
@@ -207,14 +255,11 @@ def run(ctx: click.Context) -> None:
         logger.error("Failed to start signage system")
         sys.exit(1)
 
-    # Main loop
+    # Block until the scheduler requests shutdown (e.g., user pressed q in MPV)
     try:
-        while cli_obj.running:
-            # Check if scheduler has requested shutdown (e.g., user pressed q in MPV)
-            if cli_obj.scheduler and cli_obj.scheduler.stop_event.is_set():
-                logger.info("Scheduler requested shutdown")
-                break
-            time.sleep(1.0)
+        if cli_obj.scheduler:
+            cli_obj.scheduler.stop_event.wait()
+            logger.info("Scheduler requested shutdown")
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     finally:
@@ -227,9 +272,7 @@ def status(ctx: click.Context) -> None:
     """Show current signage status."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.media_manager:
-        cli_obj.initialize()
+    cli_obj.initialize_media()
 
     status_info = cli_obj.get_status()
 
@@ -244,8 +287,7 @@ def next_media(ctx: click.Context) -> None:
     """Skip to next media file."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.scheduler and not cli_obj.initialize():
+    if not cli_obj.initialize():
         click.echo("Failed to initialize system")
         return
 
@@ -261,8 +303,7 @@ def prev(ctx: click.Context) -> None:
     """Skip to previous media file."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.scheduler and not cli_obj.initialize():
+    if not cli_obj.initialize():
         click.echo("Failed to initialize system")
         return
 
@@ -278,8 +319,7 @@ def refresh(ctx: click.Context) -> None:
     """Refresh the media playlist."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.scheduler and not cli_obj.initialize():
+    if not cli_obj.initialize_media():
         click.echo("Failed to initialize system")
         return
 
@@ -294,8 +334,7 @@ def add(ctx: click.Context, media_file: str) -> None:
     """Add a media file to the media directory."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.media_manager and not cli_obj.initialize():
+    if not cli_obj.initialize_media():
         click.echo("Failed to initialize system")
         return
 
@@ -312,8 +351,7 @@ def remove(ctx: click.Context, media_name: str) -> None:
     """Remove a media file from the media directory."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.media_manager and not cli_obj.initialize():
+    if not cli_obj.initialize_media():
         click.echo("Failed to initialize system")
         return
 
@@ -330,8 +368,7 @@ def list_media(ctx: click.Context) -> None:
     cli_obj = ctx.obj["cli"]
     config = ctx.obj["config"]
 
-    # Initialize if needed
-    if not cli_obj.media_manager and not cli_obj.initialize():
+    if not cli_obj.initialize_media():
         click.echo("Failed to initialize system")
         return
 
@@ -363,10 +400,6 @@ def system_info(ctx: click.Context) -> None:
     """Show system information."""
     cli_obj = ctx.obj["cli"]
 
-    # Initialize if needed
-    if not cli_obj.setup_manager:
-        cli_obj.setup_manager = SetupManager(ctx.obj["config"])
-
     info = cli_obj.setup_manager.get_system_info()
 
     click.echo("System Information:")
@@ -2,14 +2,63 @@
 
 import logging
 import os
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# Parsed configurations keyed by path, valid while (mtime_ns, size) is unchanged
+_yaml_cache: dict[str, tuple[tuple[int, int], "SignageConfig"]] = {}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+_ENV_MAPPING = {
+    "SIGNAGE_MEDIA_DIRECTORY": "media_directory",
+    "SIGNAGE_IMAGE_DURATION": "default_image_duration",
+    "SIGNAGE_SOCKET_PATH": "socket_path",
+    "SIGNAGE_VIDEO_OUTPUT": "video_output",
+    "SIGNAGE_HARDWARE_DECODE": "hardware_decode",
+    "SIGNAGE_FULLSCREEN": "fullscreen",
+    "SIGNAGE_TEST_MODE": "test_mode",
+    "SIGNAGE_WATCH_DIRECTORY": "watch_directory",
+    "SIGNAGE_LOG_LEVEL": "log_level",
+}
+_ENV_VARS = tuple(_ENV_MAPPING)
+
+# Parsers for non-string attributes, everything else is taken verbatim
+_ENV_PARSERS: dict[str, Callable[[str], Any]] = {
+    "default_image_duration": float,
+    "fullscreen": _parse_bool,
+    "test_mode": _parse_bool,
+    "watch_directory": _parse_bool,
+}
+
+
+def _parse_env() -> dict[str, Any]:
+    """Parse the SIGNAGE_* environment variables that are set.
+
+    Returns:
+        Parsed values keyed by config attribute name.
+    """
+    values: dict[str, Any] = {}
+
+    for env_var, attr_name in _ENV_MAPPING.items():
+        env_value = os.getenv(env_var)
+        if env_value is not None:
+            try:
+                values[attr_name] = _ENV_PARSERS.get(attr_name, str)(env_value)
+                logger.debug(f"Set {attr_name} from environment: {values[attr_name]}")
+            except (ValueError, TypeError) as e:
+                logger.error(f"Invalid value for {env_var}: {env_value} ({e})")
+
+    return values
+
 
 @dataclass
 class SignageConfig:
@@ -41,11 +90,23 @@ class SignageConfig:
     @classmethod
     def from_yaml(cls, config_path: str) -> "SignageConfig":
         """Load configuration from YAML file."""
+        import yaml
+
         try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+            st = os.stat(config_path)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            cached = _yaml_cache.get(config_path)
+            if cached is not None and cached[0] == cache_key:
+                logger.debug(f"Using cached configuration for {config_path}")
+                return replace(cached[1])
+
+            # Prefer the libyaml-backed loader when available; binary mode lets it decode the bytes itself
+            with open(config_path, "rb") as f:
+                data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
             logger.info(f"Loaded configuration from {config_path}")
-            return cls.from_dict(data)
+            config = cls.from_dict(data)
+            _yaml_cache[config_path] = (cache_key, replace(config))
+            return config
         except FileNotFoundError:
             logger.info(f"Configuration file not found: {config_path}, using defaults")
             return cls()
@@ -61,38 +122,8 @@ class SignageConfig:
         """Load configuration from environment variables."""
         config = cls()
 
-        env_mapping = {
-            "SIGNAGE_MEDIA_DIRECTORY": "media_directory",
-            "SIGNAGE_IMAGE_DURATION": "default_image_duration",
-            "SIGNAGE_SOCKET_PATH": "socket_path",
-            "SIGNAGE_VIDEO_OUTPUT": "video_output",
-            "SIGNAGE_HARDWARE_DECODE": "hardware_decode",
-            "SIGNAGE_FULLSCREEN": "fullscreen",
-            "SIGNAGE_TEST_MODE": "test_mode",
-            "SIGNAGE_WATCH_DIRECTORY": "watch_directory",
-            "SIGNAGE_LOG_LEVEL": "log_level",
-        }
-
-        for env_var, attr_name in env_mapping.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                try:
-                    attr_type = type(getattr(config, attr_name))
-
-                    parsed_value: bool | float | int | str
-                    if attr_type is bool:
-                        parsed_value = env_value.lower() in ("true", "1", "yes", "on")
-                    elif attr_type is float:
-                        parsed_value = float(env_value)
-                    elif attr_type is int:
-                        parsed_value = int(env_value)
-                    else:
-                        parsed_value = env_value
-
-                    setattr(config, attr_name, parsed_value)
-                    logger.debug(f"Set {attr_name} from environment: {parsed_value}")
-                except (ValueError, TypeError) as e:
-                    logger.error(f"Invalid value for {env_var}: {env_value} ({e})")
+        for attr_name, parsed_value in _parse_env().items():
+            setattr(config, attr_name, parsed_value)
 
         return config
 
@@ -110,12 +141,11 @@ class SignageConfig:
 
         config = cls.from_yaml(config_path)
 
-        env_config = cls.from_env()
-        for attr_name in config.__dataclass_fields__:
-            env_value = getattr(env_config, attr_name)
-            default_value = getattr(cls(), attr_name)
-            if env_value != default_value:
-                setattr(config, attr_name, env_value)
+        # Skip the merge entirely when no SIGNAGE_* override is set (the common case)
+        if any(env_var in os.environ for env_var in _ENV_VARS):
+            for attr_name, env_value in _parse_env().items():
+                if env_value != getattr(_DEFAULTS, attr_name):
+                    setattr(config, attr_name, env_value)
 
         config.validate()
         return config
@@ -152,10 +182,13 @@ class SignageConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
-        return {field.name: getattr(self, field.name) for field in self.__dataclass_fields__.values()}
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
 
     def save_to_yaml(self, path: str) -> None:
         """Save configuration to YAML file."""
+        import yaml
+
+        _yaml_cache.pop(path, None)
         try:
             with open(path, "w") as f:
                 yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
@@ -163,3 +196,9 @@ class SignageConfig:
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             raise
+
+
+_FIELD_NAMES = tuple(SignageConfig.__dataclass_fields__)
+
+# Default values, used to tell which environment variables override the config file
+_DEFAULTS = SignageConfig()
@@ -1,7 +1,9 @@
 """Media file management and operations."""
 
+import bisect
+import contextlib
 import logging
-import mimetypes
+import os
 import shutil
 from pathlib import Path
 from typing import ClassVar
@@ -12,44 +14,56 @@ logger = logging.getLogger(__name__)
 class MediaFile:
     """Represents a media file with metadata."""
 
-    VIDEO_EXTENSIONS: ClassVar[set[str]] = {
-        ".mp4",
-        ".avi",
-        ".mkv",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".m4v",
-        ".mpg",
-        ".mpeg",
-    }
-    IMAGE_EXTENSIONS: ClassVar[set[str]] = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp", ".svg"}
-    SUPPORTED_EXTENSIONS: ClassVar[set[str]] = VIDEO_EXTENSIONS | IMAGE_EXTENSIONS
-
-    def __init__(self, path: Path, default_image_duration: float = 5.0) -> None:
+    VIDEO_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            ".mp4",
+            ".avi",
+            ".mkv",
+            ".mov",
+            ".wmv",
+            ".flv",
+            ".webm",
+            ".m4v",
+            ".mpg",
+            ".mpeg",
+        }
+    )
+    IMAGE_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp", ".svg"}
+    )
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = VIDEO_EXTENSIONS | IMAGE_EXTENSIONS
+
+    def __init__(self, path: Path, default_image_duration: float = 5.0, suffix: str | None = None) -> None:
         """Initialize media file.
 
         Args:
             path: Path to the media file.
             default_image_duration: Default duration for image files.
+            suffix: Lowercased file extension, if already computed by the caller.
         """
         self.path = path
         self.name = path.name
+        self._suffix = suffix if suffix is not None else self._normalized_suffix(path)
         self.is_video = self._is_video()
         self.duration = None if self.is_video else default_image_duration
 
     def _is_video(self) -> bool:
-        """Check if file is a video based on MIME type and extension."""
-        mime_type, _ = mimetypes.guess_type(str(self.path))
-        if mime_type:
-            return mime_type.startswith("video/")
-        return self.path.suffix.lower() in self.VIDEO_EXTENSIONS
+        """Check if file is a video based on its extension."""
+        return self._suffix in self.VIDEO_EXTENSIONS
+
+    @staticmethod
+    def _normalized_suffix(path: Path) -> str:
+        """Get the lowercased file extension used for type checks."""
+        return path.suffix.lower()
 
     @classmethod
-    def is_supported(cls, path: Path) -> bool:
+    def is_supported(cls, path: Path, suffix: str | None = None) -> bool:
         """Check if file extension is supported."""
-        return path.suffix.lower() in cls.SUPPORTED_EXTENSIONS and not path.name.startswith(".")
+        if path.name.startswith("."):
+            return False
+        if suffix is None:
+            suffix = cls._normalized_suffix(path)
+        return suffix in cls.SUPPORTED_EXTENSIONS
 
     def __str__(self) -> str:
         """String representation."""
@@ -77,6 +91,10 @@ class MediaManager:
         self.media_directory = Path(media_directory)
         self.default_image_duration = default_image_duration
         self.playlist: list[MediaFile] = []
+        # Playlist position by file name, kept in playlist order
+        self._by_name: dict[str, int] = {}
+        self._video_count = 0
+        self._image_count = 0
         self.current_index = 0
 
         if not self.media_directory.exists():
@@ -93,12 +111,25 @@ class MediaManager:
         media_files = []
 
         try:
-            files = [f for f in self.media_directory.iterdir() if f.is_file() and MediaFile.is_supported(f)]
+            # Compute each suffix once and reject by extension before is_file(), which
+            # scandir answers from the directory entry without an extra stat for regular files
+            files = []
+            supported = MediaFile.SUPPORTED_EXTENSIONS
+            splitext = os.path.splitext
+            with os.scandir(self.media_directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name[:1] == ".":
+                        continue
+                    suffix = splitext(name)[1].lower()
+                    if suffix in supported and entry.is_file():
+                        files.append((name, suffix))
             files.sort()
 
-            for file_path in files:
+            for name, suffix in files:
+                file_path = self.media_directory / name
                 try:
-                    media_file = MediaFile(file_path, self.default_image_duration)
+                    media_file = MediaFile(file_path, self.default_image_duration, suffix=suffix)
                     media_files.append(media_file)
                     logger.debug(f"Found media file: {media_file}")
                 except Exception as e:
@@ -116,13 +147,15 @@ class MediaManager:
         old_current = self.get_current_media()
 
         self.playlist = self.scan_directory()
+        self._reindex()
+        self._video_count = sum(1 for media in self.playlist if media.is_video)
+        self._image_count = len(self.playlist) - self._video_count
 
         # Try to maintain position if same file exists
-        if old_current and old_current.path.exists():
-            for i, media in enumerate(self.playlist):
-                if media.path == old_current.path:
-                    self.current_index = i
-                    break
+        if old_current:
+            index = self._by_name.get(old_current.name)
+            if index is not None:
+                self.current_index = index
 
         # Reset index if out of bounds
         if self.current_index >= len(self.playlist):
@@ -130,6 +163,84 @@ class MediaManager:
 
         logger.info(f"Playlist updated: {len(self.playlist)} files (was {old_count})")
 
+    def _reindex(self) -> None:
+        """Rebuild the name lookup after the playlist order changed."""
+        self._by_name = {media.name: i for i, media in enumerate(self.playlist)}
+
+    def _update_counts(self, media: MediaFile, delta: int) -> None:
+        """Adjust the video/image counters for an added (+1) or removed (-1) file."""
+        if media.is_video:
+            self._video_count += delta
+        else:
+            self._image_count += delta
+
+    def _insert_media(self, path: Path) -> None:
+        """Insert a single file into the sorted playlist, keeping the current selection."""
+        media_file = MediaFile(path, self.default_image_duration)
+
+        existing = self._by_name.get(media_file.name)
+        if existing is not None:
+            # Overwritten file, replace entry in place
+            self.playlist[existing] = media_file
+            return
+
+        index = bisect.bisect_left(self.playlist, media_file.name, key=lambda m: m.name)
+        self.playlist.insert(index, media_file)
+        self._reindex()
+        self._update_counts(media_file, 1)
+        if len(self.playlist) == 1:
+            self.current_index = 0
+        elif index <= self.current_index:
+            self.current_index += 1
+
+    def _remove_media(self, filename: str) -> None:
+        """Remove a single file from the playlist, keeping the current selection."""
+        index = self._by_name.get(filename)
+        if index is None:
+            return
+
+        self._update_counts(self.playlist.pop(index), -1)
+        self._reindex()
+        if index < self.current_index:
+            self.current_index -= 1
+
+        # Reset index if out of bounds
+        if self.current_index >= len(self.playlist):
+            self.current_index = 0 if self.playlist else -1
+
+    def add_path(self, path: Path) -> bool:
+        """Add a file that appeared in the media directory to the playlist.
+
+        Args:
+            path: Path of the new file inside the media directory.
+
+        Returns:
+            True if the playlist changed.
+        """
+        if not MediaFile.is_supported(path):
+            return False
+
+        self._insert_media(path)
+        logger.info(f"Playlist updated: {len(self.playlist)} files (added {path.name})")
+        return True
+
+    def remove_path(self, path: Path) -> bool:
+        """Remove a file that disappeared from the media directory from the playlist.
+
+        Args:
+            path: Path of the removed file inside the media directory.
+
+        Returns:
+            True if the playlist changed.
+        """
+        old_count = len(self.playlist)
+        self._remove_media(path.name)
+        if len(self.playlist) == old_count:
+            return False
+
+        logger.info(f"Playlist updated: {len(self.playlist)} files (removed {path.name})")
+        return True
+
     def get_current_media(self) -> MediaFile | None:
         """Get currently selected media file."""
         if not self.playlist or self.current_index < 0:
@@ -180,14 +291,23 @@ class MediaManager:
         dest_path = self.media_directory / source_path.name
 
         try:
-            shutil.copy2(source_path, dest_path)
+            # copyfile() copies in-kernel (os.sendfile) on Linux; metadata is best effort so
+            # filesystems without chmod/utime support (e.g. FAT media sticks) still accept the file
+            shutil.copyfile(source_path, dest_path)
+            with contextlib.suppress(OSError):
+                shutil.copystat(source_path, dest_path)
             logger.info(f"Added media file: {dest_path.name}")
-            self.refresh_playlist()
-            return True
         except Exception as e:
             logger.error(f"Failed to add media file: {e}")
             return False
 
+        try:
+            self._insert_media(dest_path)
+        except Exception as e:
+            logger.warning(f"Incremental playlist update failed, rescanning: {e}")
+            self.refresh_playlist()
+        return True
+
     def remove_media_file(self, filename: str) -> bool:
         """Remove a media file from the media directory.
 
@@ -203,8 +323,6 @@ class MediaManager:
             if file_path.exists():
                 file_path.unlink()
                 logger.info(f"Removed media file: {filename}")
-                self.refresh_playlist()
-                return True
             else:
                 logger.warning(f"Media file not found: {filename}")
                 return False
@@ -212,9 +330,17 @@ class MediaManager:
             logger.error(f"Failed to remove media file: {e}")
             return False
 
+        try:
+            self._remove_media(filename)
+        except Exception as e:
+            logger.warning(f"Incremental playlist update failed, rescanning: {e}")
+            self.refresh_playlist()
+        return True
+
     def list_media_files(self) -> list[str]:
         """Get list of media filenames in the directory."""
-        return [media.name for media in self.playlist]
+        # The name lookup is kept in playlist order
+        return list(self._by_name)
 
     def get_playlist_info(self) -> dict:
         """Get information about current playlist state."""
@@ -224,8 +350,8 @@ class MediaManager:
             "current_index": self.current_index,
             "current_file": str(current_media) if current_media else None,
             "media_directory": str(self.media_directory),
-            "has_videos": any(m.is_video for m in self.playlist),
-            "has_images": any(not m.is_video for m in self.playlist),
+            "has_videos": self._video_count > 0,
+            "has_images": self._image_count > 0,
         }
 
     def is_empty(self) -> bool:
@@ -1,5 +1,7 @@
 """MPV player controller with IPC socket communication."""
 
+import contextlib
+import errno
 import json
 import logging
 import os
@@ -8,16 +10,61 @@ import shutil
 import socket
 import subprocess
 import tempfile
+import threading
 import time
+from collections.abc import Callable
+from io import IOBase
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+try:
+    # Optional, noticeably faster for the IPC messages exchanged on every command
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# The platform does not change while we run, so look it up once at import
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+# DRM devices are created at boot, only probed on ARM boards where they select the output
+_HAS_ARM_DRI = ("arm" in _MACHINE or "aarch" in _MACHINE) and os.path.exists("/dev/dri")
+
 
 class MPVController:
     """Control MPV player via IPC socket."""
 
+    # How long an is_running() result is reused, so commands sent in one burst
+    # share a single waitpid() instead of polling the process each time
+    POLL_CACHE_SECONDS = 0.05
+    # How long to wait for MPV to create its IPC socket after launch
+    STARTUP_TIMEOUT = 5.0
+    # How long to wait for the reader thread to deliver a command response
+    RESPONSE_TIMEOUT = 3.0
+    # Timed-out commands in a row before the connection is considered wedged
+    MAX_CONSECUTIVE_TIMEOUTS = 3
+    # Properties MPV pushes to us on change, instead of being polled. time-pos is
+    # left out on purpose: it changes every frame and would flood the reader thread.
+    OBSERVED_PROPERTIES: ClassVar[tuple[str, ...]] = ("eof-reached", "duration", "pause")
+
+    # Pre-serialized constant commands; only the request id is filled in at send time
+    _CMD_PLAY: ClassVar[bytes] = b'{"command":["set_property","pause",false],"request_id":%d}\n'
+    _CMD_PAUSE: ClassVar[bytes] = b'{"command":["set_property","pause",true],"request_id":%d}\n'
+    _CMD_NEXT: ClassVar[bytes] = b'{"command":["playlist-next"],"request_id":%d}\n'
+    _CMD_PREV: ClassVar[bytes] = b'{"command":["playlist-prev"],"request_id":%d}\n'
+    _CMD_CLEAR: ClassVar[bytes] = b'{"command":["playlist-clear"],"request_id":%d}\n'
+    _CMD_QUIT: ClassVar[bytes] = b'{"command":["quit"],"request_id":%d}\n'
+
     def __init__(
         self,
         socket_path: str | None = None,
@@ -42,21 +89,57 @@ class MPVController:
         self.test_mode = test_mode
         self.process: subprocess.Popen | None = None
         self.socket: socket.socket | None = None
+        self._rfile: IOBase | None = None
+        self._reader: threading.Thread | None = None
+        # Guards the state below, which the reader thread fills from IPC messages
+        self._state_changed = threading.Condition()
+        self._responses: dict[int, dict[str, Any]] = {}
+        self._properties: dict[str, Any] = {}
+        # Requests given up on after a timeout, whose late responses are dropped
+        self._abandoned: set[int] = set()
+        self._consecutive_timeouts = 0
         self.request_id = 0
+        self._last_poll_time = 0.0
+        self._last_poll_result = False
+        # Built once, start() runs again on every restart after a player crash
+        self._mpv_argv = self._build_argv()
+
+    def _build_argv(self) -> list[str]:
+        """Build the MPV command line from the controller settings."""
+        cmd = [
+            "mpv",
+            f"--input-ipc-server={self.socket_path}",
+            f"--vo={self.video_output}",
+            f"--hwdec={self.hardware_decode}",
+            "--idle=yes",
+            "--force-window=yes",
+            "--keep-open=always",
+            "--image-display-duration=inf",
+            "--no-osc",
+            "--cursor-autohide=always",
+            "--no-config",
+            "--quiet",  # Reduce output noise
+        ]
+
+        if self.fullscreen:
+            cmd.append("--fullscreen")
+
+        if self.video_output == "drm":
+            # Use first available connector, preferred mode
+            cmd.append("--drm-mode=preferred")
+
+        return cmd
 
     def _detect_video_output(self) -> str:
         """Auto-detect appropriate video output based on platform."""
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-
-        if ("arm" in machine or "aarch" in machine) and os.path.exists("/dev/dri"):
+        if _HAS_ARM_DRI:
             logger.info("Detected Raspberry Pi, using DRM output")
             return "drm"
 
-        if system == "darwin":
+        if _SYSTEM == "darwin":
             logger.info("Detected macOS, using gpu output")
             return "gpu"
-        elif system == "linux":
+        elif _SYSTEM == "linux":
             if os.environ.get("DISPLAY"):
                 logger.info("Detected Linux with X11/Wayland, using gpu output")
                 return "gpu"
@@ -84,44 +167,39 @@ class MPVController:
         if self.process is None:
             return False
 
+        now = time.monotonic()
+        if now - self._last_poll_time < self.POLL_CACHE_SECONDS:
+            return self._last_poll_result
+
         poll_result = self.process.poll()
+        self._last_poll_time = now
+        self._last_poll_result = poll_result is None
         if poll_result is not None:
             # Process has terminated
             if poll_result == 0:
                 logger.info("MPV process exited normally (user quit)")
             else:
                 logger.warning(f"MPV process terminated with exit code {poll_result}")
-                self._log_mpv_output()
             return False
 
         return True
 
+    def _invalidate_poll_cache(self) -> None:
+        """Force the next is_running() call to poll the process."""
+        self._last_poll_time = 0.0
+
     def get_exit_code(self) -> int | None:
         """Get the exit code of the MPV process if it has terminated."""
         if self.process is None:
             return None
         return self.process.poll()
 
-    def _log_mpv_output(self) -> None:
-        """Log any available output from MPV process."""
-        if self.process and self.process.stdout:
-            try:
-                # Read any available output
-                import select
-
-                ready, _, _ = select.select([self.process.stdout], [], [], 0)
-                if ready:
-                    output = self.process.stdout.read()
-                    if output:
-                        logger.warning(f"MPV output: {output.strip()}")
-            except Exception as e:
-                logger.debug(f"Could not read MPV output: {e}")
-
     def start(self) -> bool:
         """Start MPV process with IPC socket."""
         if not self._check_mpv_installed():
             return False
 
+        self._invalidate_poll_cache()
         if self.is_running():
             logger.warning("MPV is already running")
             return True
@@ -129,142 +207,314 @@ class MPVController:
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
 
-        cmd = [
-            "mpv",
-            f"--input-ipc-server={self.socket_path}",
-            f"--vo={self.video_output}",
-            f"--hwdec={self.hardware_decode}",
-            "--idle=yes",
-            "--force-window=yes",
-            "--keep-open=always",
-            "--image-display-duration=inf",
-            "--no-osc",
-            "--cursor-autohide=always",
-            "--no-config",
-            "--quiet",  # Reduce output noise
-        ]
-
-        if self.fullscreen:
-            cmd.append("--fullscreen")
-
-        if self.video_output == "drm":
-            # Use first available connector, preferred mode
-            cmd.append("--drm-mode=preferred")
-
         try:
-            logger.info(f"Starting MPV with command: {' '.join(cmd)}")
+            logger.info(f"Starting MPV with command: {' '.join(self._mpv_argv)}")
             self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                universal_newlines=True,
-                bufsize=1,  # Line buffered
+                self._mpv_argv,
+                # Nothing reads MPV's output; a pipe would block MPV once it filled up
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-
-            # Wait for socket to be created
-            for _attempt in range(50):
-                if os.path.exists(self.socket_path):
+            self._invalidate_poll_cache()
+
+            # Connect as soon as MPV is listening; retrying connect() wakes up within
+            # milliseconds of the socket appearing instead of sleeping in 100 ms steps
+            deadline = time.monotonic() + self.STARTUP_TIMEOUT
+            while True:
+                try:
+                    self._open_socket()
                     break
-                if not self.is_running():
-                    logger.error("MPV process died during startup")
-                    return False
-                time.sleep(0.1)
-            else:
-                logger.error("MPV socket not created after 5 seconds")
-                self.stop()
-                return False
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if not self.is_running():
+                        logger.error("MPV process died during startup")
+                        return False
+                    if time.monotonic() >= deadline:
+                        logger.error(f"MPV socket not created after {self.STARTUP_TIMEOUT:g} seconds")
+                        self.stop()
+                        return False
+                    time.sleep(0.005)
 
-            return self._connect_socket()
+            logger.info(f"Connected to MPV socket at {self.socket_path}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to start MPV: {e}")
             return False
 
-    def _connect_socket(self) -> bool:
-        """Connect to MPV IPC socket."""
+    def _close_socket(self) -> None:
+        """Close the IPC connection so the next command reconnects."""
+        sock, rfile, reader = self.socket, self._rfile, self._reader
+        self.socket = None
+        self._rfile = None
+        self._reader = None
+
+        if sock is not None:
+            # Unblocks the reader thread's readline()
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+        if reader is not None and reader is not threading.current_thread():
+            reader.join(timeout=1.0)
+        if rfile is not None:
+            with contextlib.suppress(OSError):
+                rfile.close()
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.close()
+
+        with self._state_changed:
+            self._responses.clear()
+            self._abandoned.clear()
+            self._properties.clear()
+            self._state_changed.notify_all()
+
+    def _open_socket(self) -> socket.socket:
+        """Open the IPC connection and start the reader thread.
+
+        Returns:
+            The connected socket, also stored as self.socket.
+
+        Raises:
+            OSError: If the socket cannot be connected.
+        """
+        self._close_socket()
+        # MPV's --input-ipc-server only listens with SOCK_STREAM, so SOCK_SEQPACKET
+        # message framing is not an option. Messages are newline-delimited JSON and
+        # the buffered makefile() reader reassembles them with readline().
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+
+        self.socket = sock
+        self._rfile = sock.makefile("rb", buffering=65536)
+        self._reader = threading.Thread(
+            target=self._read_messages, args=(self._rfile,), name="mpv-ipc-reader", daemon=True
+        )
+        self._reader.start()
+
+        # Responses to these carry no request_id and are ignored by the reader
+        observe = b"".join(
+            _json_dumps({"command": ["observe_property", i, name]}) + b"\n"
+            for i, name in enumerate(self.OBSERVED_PROPERTIES, 1)
+        )
+        sock.sendall(observe)
+        return sock
+
+    def _connect_socket(self) -> socket.socket | None:
+        """Connect to MPV IPC socket.
+
+        The connection is kept open and reused by every command until an error forces a reconnect.
+        A reader thread dispatches responses and property-change events from MPV.
+
+        Returns:
+            The connected socket, or None if connecting failed.
+        """
         try:
-            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.socket.connect(self.socket_path)
-            self.socket.settimeout(5.0)
+            sock = self._open_socket()
             logger.info(f"Connected to MPV socket at {self.socket_path}")
-            return True
+            return sock
         except Exception as e:
             logger.error(f"Failed to connect to MPV socket: {e}")
-            return False
+            self._close_socket()
+            return None
 
-    def _send_command(self, command: list[Any]) -> dict[str, Any] | None:
+    def _read_messages(self, rfile: IOBase) -> None:
+        """Dispatch newline-delimited IPC messages until the connection closes."""
+        try:
+            for line in rfile:
+                try:
+                    message: dict[str, Any] = _json_loads(line)
+                except ValueError as e:
+                    logger.debug(f"Ignoring malformed MPV message: {e}")
+                    continue
+
+                with self._state_changed:
+                    if message.get("event") == "property-change":
+                        self._properties[message["name"]] = message.get("data")
+                    elif "event" not in message and message.get("request_id"):
+                        request_id = message["request_id"]
+                        if request_id in self._abandoned:
+                            self._abandoned.discard(request_id)
+                            continue
+                        self._responses[request_id] = message
+                    else:
+                        continue
+                    self._state_changed.notify_all()
+        except (OSError, ValueError) as e:
+            logger.debug(f"MPV IPC reader stopped: {e}")
+        finally:
+            with self._state_changed:
+                self._state_changed.notify_all()
+
+    def _send_command(self, command: list[Any] | bytes, timeout: float | None = None) -> dict[str, Any] | None:
         """Send command to MPV via IPC socket."""
+        return self._send_commands([command], timeout)[0]
+
+    def _send_commands(
+        self, commands: list[list[Any] | bytes], timeout: float | None = None
+    ) -> list[dict[str, Any] | None]:
+        """Send several commands to MPV in a single write and collect their responses.
+
+        The socket itself stays blocking without a timeout; only the wait for the
+        reader thread to deliver responses is bounded.
+
+        Args:
+            commands: MPV command lists, or one of the pre-serialized _CMD_* templates.
+            timeout: Seconds to wait for responses, RESPONSE_TIMEOUT if None.
+
+        Returns:
+            One response per command, in order; None where no response arrived.
+        """
+        no_responses: list[dict[str, Any] | None] = [None] * len(commands)
+
         # Check if MPV process is still running
         if not self.is_running():
             logger.error("MPV process is not running")
-            return None
-
-        if not self.socket and not self._connect_socket():
-            return None
-
-        self.request_id += 1
-        request = {
-            "command": command,
-            "request_id": self.request_id,
-        }
+            return no_responses
+
+        sock = self.socket or self._connect_socket()
+        if sock is None:
+            return no_responses
+
+        request_ids = []
+        requests = []
+        with self._state_changed:
+            for command in commands:
+                self.request_id += 1
+                request_ids.append(self.request_id)
+                if isinstance(command, bytes):
+                    requests.append(command % self.request_id)
+                else:
+                    requests.append(_json_dumps({"command": command, "request_id": self.request_id}) + b"\n")
 
-        # Try the command with retry logic
+        # Try the commands with retry logic
+        msg = b"".join(requests)
+        if timeout is None:
+            timeout = self.RESPONSE_TIMEOUT
+        sent = False
         max_retries = 2
         for attempt in range(max_retries):
-            original_timeout = None
             try:
-                msg = json.dumps(request) + "\n"
-                if self.socket is not None:
-                    self.socket.send(msg.encode("utf-8"))
-                else:
-                    logger.error("Socket is None when trying to send data")
-                    return None
-
-                # Set a shorter timeout for receiving response
-                if self.socket is not None:
-                    original_timeout = self.socket.gettimeout()
-                    self.socket.settimeout(3.0)
-                    response_data = self.socket.recv(4096).decode("utf-8")
-                    self.socket.settimeout(original_timeout)
-                else:
-                    logger.error("Socket is None when trying to receive data")
-                    return None
+                if not sent:
+                    # sendall: a large batch may not fit the socket buffer in one write
+                    sock.sendall(msg)
+                    sent = True
+
+                responses = self._wait_for_responses(request_ids, timeout)
+                self._consecutive_timeouts = 0
 
-                for line in response_data.strip().split("\n"):
-                    if line:
-                        response: dict[str, Any] = json.loads(line)
-                        if response.get("request_id") == self.request_id:
-                            if response.get("error") != "success":
-                                logger.debug(f"MPV command response: {response.get('error')}")
-                            return response
+                for response in responses.values():
+                    if response.get("error") != "success":
+                        logger.debug(f"MPV command response: {response.get('error')}")
+                return [responses.get(request_id) for request_id in request_ids]
 
             except TimeoutError:
                 logger.warning(f"Timeout waiting for MPV response (attempt {attempt + 1}/{max_retries})")
+                self._consecutive_timeouts += 1
+                if self._consecutive_timeouts >= self.MAX_CONSECUTIVE_TIMEOUTS:
+                    # MPV keeps not answering, the connection itself is likely wedged
+                    logger.error("MPV stopped answering, reconnecting")
+                    self._consecutive_timeouts = 0
+                    self._close_socket()
+                    if attempt < max_retries - 1 and (reconnected := self._connect_socket()):
+                        sock = reconnected
+                        sent = False
+                        continue
+                    return no_responses
                 if attempt < max_retries - 1:
-                    # Try to reconnect for next attempt
-                    self.socket = None
-                    if not self._connect_socket():
-                        break
+                    # The connection is still up, keep waiting for the same response
+                    timeout *= 2
                 else:
                     logger.error("Final timeout waiting for MPV response")
-                    self.socket = None
-                    return None
-            except (OSError, json.JSONDecodeError) as e:
+                    self._abandon_responses(request_ids)
+                    return no_responses
+            except OSError as e:
                 logger.warning(f"Socket error (attempt {attempt + 1}/{max_retries}): {e}")
-                self.socket = None
+                if not self._is_connection_lost(e):
+                    self._abandon_responses(request_ids)
+                    return no_responses
+                self._close_socket()
                 if attempt < max_retries - 1:
                     # Try to reconnect for next attempt
-                    if not self._connect_socket():
+                    reconnected = self._connect_socket()
+                    if reconnected is None:
                         break
+                    sock = reconnected
+                    sent = False
                 else:
                     logger.error(f"Final socket error: {e}")
-                    return None
+                    return no_responses
 
-        return None
+        return no_responses
+
+    @staticmethod
+    def _is_connection_lost(error: OSError) -> bool:
+        """Check if a socket error means the IPC connection has to be re-established."""
+        return isinstance(error, ConnectionError) or error.errno in (errno.ENOTCONN, errno.EBADF)
+
+    def _abandon_responses(self, request_ids: list[int]) -> None:
+        """Drop responses for requests that were given up on, including ones that arrive later."""
+        with self._state_changed:
+            for request_id in request_ids:
+                if self._responses.pop(request_id, None) is None:
+                    self._abandoned.add(request_id)
+
+    def _wait_for_responses(self, request_ids: list[int], timeout: float) -> dict[int, dict[str, Any]]:
+        """Wait until the reader thread has delivered a response for every request ID.
+
+        Raises:
+            TimeoutError: If MPV did not answer within timeout seconds.
+            ConnectionError: If the IPC connection closed while waiting.
+        """
+        reader = self._reader
+
+        def done() -> bool:
+            return all(request_id in self._responses for request_id in request_ids) or not (
+                reader and reader.is_alive()
+            )
+
+        with self._state_changed:
+            if not self._state_changed.wait_for(done, timeout=timeout):
+                raise TimeoutError("No response from MPV")
+            responses = {
+                request_id: self._responses.pop(request_id)
+                for request_id in request_ids
+                if request_id in self._responses
+            }
+
+        if len(responses) < len(request_ids):
+            raise ConnectionError("MPV closed the IPC connection")
+        return responses
+
+    def get_observed_property(self, property_name: str) -> Any:
+        """Get the last value MPV pushed for one of OBSERVED_PROPERTIES."""
+        with self._state_changed:
+            return self._properties.get(property_name)
+
+    def wait_for_observed(self, predicate: Callable[[dict[str, Any]], bool], timeout: float) -> bool:
+        """Block until observed properties satisfy predicate, or the timeout expires.
+
+        Args:
+            predicate: Called with the observed property values on each change.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The final result of the predicate.
+        """
+        with self._state_changed:
+            return self._state_changed.wait_for(lambda: predicate(self._properties), timeout=timeout)
+
+    def interrupt_wait(self) -> None:
+        """Wake threads blocked in wait_for_observed so they re-check their predicate."""
+        with self._state_changed:
+            self._state_changed.notify_all()
 
     def restart(self) -> bool:
         """Restart MPV process."""
         logger.info("Restarting MPV process...")
+        self._invalidate_poll_cache()
         self.stop()
         time.sleep(1.0)
         return self.start()
@@ -276,10 +526,6 @@ class MPVController:
             file_path: Path to the media file.
             duration: Duration in seconds for images (None for videos).
         """
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            return False
-
         # Try to restart MPV if it's not running
         if not self.is_running():
             logger.warning("MPV not running, attempting restart...")
@@ -292,11 +538,15 @@ class MPVController:
             logger.error("No response from MPV for loadfile command")
             return False
         if response.get("error") != "success":
-            logger.error(f"MPV loadfile error: {response.get('error')}")
+            logger.error(f"MPV loadfile error for {file_path}: {response.get('error')}")
             return False
 
+        # Don't let the previous file's end-of-file state leak into the new one
+        with self._state_changed:
+            self._properties["eof-reached"] = False
+
         # Start playback (MPV starts paused by default)
-        play_response = self._send_command(["set_property", "pause", False])
+        play_response = self._send_command(self._CMD_PLAY)
         if not play_response or play_response.get("error") != "success":
             logger.warning("Failed to start playback, but file loaded")
 
@@ -308,36 +558,34 @@ class MPVController:
 
     def append_to_playlist(self, file_path: str) -> bool:
         """Append a file to the playlist."""
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            return False
-
         response = self._send_command(["loadfile", file_path, "append"])
+        if response and response.get("error") != "success":
+            logger.error(f"MPV loadfile error for {file_path}: {response.get('error')}")
         return response is not None and response.get("error") == "success"
 
     def play(self) -> bool:
         """Start playback."""
-        response = self._send_command(["set_property", "pause", False])
+        response = self._send_command(self._CMD_PLAY)
         return response is not None and response.get("error") == "success"
 
     def pause(self) -> bool:
         """Pause playback."""
-        response = self._send_command(["set_property", "pause", True])
+        response = self._send_command(self._CMD_PAUSE)
         return response is not None and response.get("error") == "success"
 
     def next(self) -> bool:
         """Skip to next item in playlist."""
-        response = self._send_command(["playlist-next"])
+        response = self._send_command(self._CMD_NEXT)
         return response is not None and response.get("error") == "success"
 
     def previous(self) -> bool:
         """Skip to previous item in playlist."""
-        response = self._send_command(["playlist-prev"])
+        response = self._send_command(self._CMD_PREV)
         return response is not None and response.get("error") == "success"
 
     def clear_playlist(self) -> bool:
         """Clear the playlist."""
-        response = self._send_command(["playlist-clear"])
+        response = self._send_command(self._CMD_CLEAR)
         return response is not None and response.get("error") == "success"
 
     def get_property(self, property_name: str) -> Any:
@@ -347,6 +595,18 @@ class MPVController:
             return response.get("data")
         return None
 
+    def get_properties(self, property_names: list[str]) -> dict[str, Any]:
+        """Get several property values from MPV in one round-trip.
+
+        Returns:
+            Values keyed by property name; None for unavailable properties.
+        """
+        responses = self._send_commands([["get_property", name] for name in property_names])
+        return {
+            name: response.get("data") if response and response.get("error") == "success" else None
+            for name, response in zip(property_names, responses, strict=True)
+        }
+
     def set_property(self, property_name: str, value: Any) -> bool:
         """Set a property value in MPV."""
         response = self._send_command(["set_property", property_name, value])
@@ -355,12 +615,10 @@ class MPVController:
     def stop(self) -> None:
         """Stop MPV process and cleanup."""
         if self.socket:
-            import contextlib
-
             with contextlib.suppress(Exception):
-                self._send_command(["quit"])
-            self.socket.close()
-            self.socket = None
+                # Don't hold up shutdown on a wedged MPV, it gets terminated below anyway
+                self._send_command(self._CMD_QUIT, timeout=1.0)
+            self._close_socket()
 
         if self.process:
             try:
@@ -373,10 +631,9 @@ class MPVController:
                 logger.error(f"Error stopping MPV: {e}")
             finally:
                 self.process = None
+                self._invalidate_poll_cache()
 
         if os.path.exists(self.socket_path):
-            import contextlib
-
             with contextlib.suppress(Exception):
                 os.unlink(self.socket_path)
 
@@ -1,45 +1,140 @@
 """Scheduler for managing signage playback and timing."""
 
 import logging
+import os
 import time
-from threading import Event, Thread
-from typing import TYPE_CHECKING, Any
-
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from pathlib import Path
+from threading import Event, Lock, Thread, Timer
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_DELETED,
+    EVENT_TYPE_MOVED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer as WatchdogObserver
+from watchdog.observers.polling import PollingObserver
 
 if TYPE_CHECKING:
     pass
 
-from .media_manager import MediaManager
+from .media_manager import MediaFile, MediaManager
 from .player import MPVController
 
 logger = logging.getLogger(__name__)
 
+# Filesystems where inotify does not see changes made by other hosts
+NETWORK_FILESYSTEMS = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs"})
+POLLING_INTERVAL = 60.0
+
+
+def _is_network_filesystem(path: Path) -> bool:
+    """Check if path is on a network filesystem, based on /proc/self/mounts."""
+    try:
+        resolved = str(path.resolve())
+        mount_point, fs_type = "", ""
+        with open("/proc/self/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                candidate = fields[1]
+                if len(candidate) <= len(mount_point):
+                    continue
+                if resolved == candidate or resolved.startswith(candidate.rstrip("/") + "/"):
+                    mount_point, fs_type = candidate, fields[2]
+        return fs_type in NETWORK_FILESYSTEMS
+    except OSError:
+        # No /proc (e.g. macOS), assume a local filesystem
+        return False
+
+
+def _is_eof(properties: dict[str, Any]) -> bool:
+    """Check observed MPV properties for end of file."""
+    return properties.get("eof-reached") is True
+
 
 class MediaWatcher(FileSystemEventHandler):
     """Watch media directory for changes."""
 
+    # Only these event types can change the playlist
+    HANDLED_EVENTS: ClassVar[frozenset[str]] = frozenset({EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, EVENT_TYPE_MOVED})
+    # Quiet period after the last event before queued changes reach the playlist,
+    # so a burst of copies (rsync, file managers) is applied in one go
+    DEBOUNCE_SECONDS: ClassVar[float] = 0.5
+
     def __init__(self, scheduler: "SignageScheduler") -> None:
         """Initialize media watcher."""
         self.scheduler = scheduler
+        # Pending changes as path -> exists, in order of their latest event
+        self._pending: dict[Path, bool] = {}
+        self._flush_timer: Timer | None = None
+        self._lock = Lock()
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Dispatch only create/delete/move events that involve supported media files."""
+        if event.event_type not in self.HANDLED_EVENTS:
+            return
+
+        # A move counts if either side is media (e.g. rsync renaming a temp file into place)
+        paths = (event.src_path, event.dest_path) if event.event_type == EVENT_TYPE_MOVED else (event.src_path,)
+        if not any(MediaFile.is_supported(Path(os.fsdecode(path))) for path in paths):
+            return
+
+        super().dispatch(event)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation."""
         if not event.is_directory:
             logger.info(f"New media file detected: {event.src_path!r}")
-            self.scheduler.refresh_playlist()
+            self._queue_change(Path(os.fsdecode(event.src_path)), exists=True)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion."""
         if not event.is_directory:
             logger.info(f"Media file deleted: {event.src_path!r}")
-            self.scheduler.refresh_playlist()
+            self._queue_change(Path(os.fsdecode(event.src_path)), exists=False)
 
-    def on_modified(self, event: FileSystemEvent) -> None:
-        """Handle file modification."""
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file rename within the media directory."""
         if not event.is_directory:
-            logger.debug(f"Media file modified: {event.src_path!r}")
+            logger.info(f"Media file moved: {event.src_path!r} -> {event.dest_path!r}")
+            self._queue_change(Path(os.fsdecode(event.src_path)), exists=False)
+            self._queue_change(Path(os.fsdecode(event.dest_path)), exists=True)
+
+    def _queue_change(self, path: Path, exists: bool) -> None:
+        """Record a change and restart the debounce timer."""
+        with self._lock:
+            # Re-insert so the latest event for a path decides its position
+            self._pending.pop(path, None)
+            self._pending[path] = exists
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = Timer(self.DEBOUNCE_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Apply all queued changes to the playlist."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flush_timer = None
+
+        for path, exists in pending.items():
+            if exists:
+                self.scheduler.add_media_path(path)
+            else:
+                self.scheduler.remove_media_path(path)
+
+    def cancel(self) -> None:
+        """Drop queued changes and stop the debounce timer."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending.clear()
 
 
 class SignageScheduler:
@@ -66,14 +161,24 @@ class SignageScheduler:
         self.stop_event = Event()
         self.playback_thread: Thread | None = None
         self.observer: Any = None
+        self.media_watcher: MediaWatcher | None = None
 
-        # Initialize playlist
-        self.media_manager.refresh_playlist()
+        # Initialize playlist unless the caller already scanned the directory
+        if self.media_manager.is_empty():
+            self.media_manager.refresh_playlist()
 
     def refresh_playlist(self) -> None:
         """Refresh the media playlist."""
         self.media_manager.refresh_playlist()
 
+    def add_media_path(self, path: Path) -> None:
+        """Add a newly detected file to the playlist."""
+        self.media_manager.add_path(path)
+
+    def remove_media_path(self, path: Path) -> None:
+        """Remove a deleted file from the playlist."""
+        self.media_manager.remove_path(path)
+
     def get_status(self) -> dict:
         """Get current scheduler status."""
         playlist_info = self.media_manager.get_playlist_info()
@@ -174,8 +279,11 @@ class SignageScheduler:
         max_wait_time = 3600  # 1 hour max per video
         video_started = False
         last_position = 0
-        stuck_count = 0
-        max_stuck_attempts = 10  # If position doesn't change for 5 seconds, assume video ended
+        last_progress_time = start_time
+        max_stuck_time = 5.0  # If position doesn't change for 5 seconds, assume video ended
+        # EOF wakes the wait below immediately, so while a video plays we only need to
+        # look at the position often enough for the near-end and stuck checks
+        max_poll_interval = 5.0
 
         logger.debug("Waiting for video completion...")
 
@@ -191,11 +299,11 @@ class SignageScheduler:
                         logger.warning("MPV process died during video playback")
                         break
 
-                # Get video properties
-                duration = self.player.get_property("duration")
+                # MPV pushes duration, pause and eof-reached; only time-pos needs a round-trip
+                duration = self.player.get_observed_property("duration")
+                paused = self.player.get_observed_property("pause")
+                eof_reached = self.player.get_observed_property("eof-reached")
                 position = self.player.get_property("time-pos")
-                paused = self.player.get_property("pause")
-                eof_reached = self.player.get_property("eof-reached")
 
                 # If we can't get basic properties, wait and retry
                 if paused is None:
@@ -226,12 +334,11 @@ class SignageScheduler:
                 # Check if video is stuck (position not advancing)
                 if video_started and position is not None:
                     if abs(position - last_position) < 0.1:  # Position hasn't advanced much
-                        stuck_count += 1
-                        if stuck_count >= max_stuck_attempts:
+                        if time.time() - last_progress_time >= max_stuck_time:
                             logger.warning(f"Video appears stuck at position {position:.1f}, assuming complete")
                             break
                     else:
-                        stuck_count = 0  # Reset counter if position advanced
+                        last_progress_time = time.time()  # Reset timer if position advanced
                     last_position = position
 
                 # Fallback: if no duration info after reasonable time, assume short video
@@ -247,7 +354,13 @@ class SignageScheduler:
                     )
                     break
 
-                self.stop_event.wait(0.5)
+                # Sleep until shortly before the expected end, capped so the checks above keep running
+                wait_time = 0.5
+                if video_started and duration and position and not paused:
+                    wait_time = min(max_poll_interval, max(0.5, duration - position - 0.5))
+
+                # Wake up early as soon as MPV reports end of file or stop() is called
+                self.player.wait_for_observed(lambda p: _is_eof(p) or self.stop_event.is_set(), timeout=wait_time)
 
             except Exception as e:
                 logger.warning(f"Error checking video progress: {e}")
@@ -271,9 +384,14 @@ class SignageScheduler:
 
         if self.watch_directory:
             try:
-                self.observer = WatchdogObserver()
-                event_handler = MediaWatcher(self)
-                self.observer.schedule(event_handler, str(self.media_manager.media_directory), recursive=False)
+                if _is_network_filesystem(self.media_manager.media_directory):
+                    logger.info("Media directory is on a network filesystem, using polling observer")
+                    self.observer = PollingObserver(timeout=POLLING_INTERVAL)
+                else:
+                    # Uses inotify on Linux, so changes are delivered without polling
+                    self.observer = WatchdogObserver()
+                self.media_watcher = MediaWatcher(self)
+                self.observer.schedule(self.media_watcher, str(self.media_manager.media_directory), recursive=False)
                 self.observer.start()
                 logger.info(f"Started watching directory: {self.media_manager.media_directory}")
             except Exception as e:
@@ -295,6 +413,7 @@ class SignageScheduler:
         logger.info("Stopping signage scheduler...")
         self.running = False
         self.stop_event.set()
+        self.player.interrupt_wait()
 
         if self.playback_thread and self.playback_thread.is_alive():
             self.playback_thread.join(timeout=5.0)
@@ -309,6 +428,10 @@ class SignageScheduler:
             except Exception as e:
                 logger.error(f"Error stopping directory observer: {e}")
 
+        if self.media_watcher:
+            self.media_watcher.cancel()
+            self.media_watcher = None
+
         self.player.stop()
         logger.info("Signage scheduler stopped")
 
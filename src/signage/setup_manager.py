@@ -5,6 +5,7 @@ import os
 import platform
 import shutil
 import signal
+import stat
 import sys
 from collections.abc import Callable
 from pathlib import Path
@@ -12,6 +13,24 @@ from pathlib import Path
 from .config import SignageConfig
 
 logger = logging.getLogger(__name__)
+_SIGNAGE_LOGGER = logging.getLogger("signage")
+
+# Logged as one record so the instructions stay together in the output
+_MPV_INSTALL_HELP = (
+    "MPV is not installed!\n"
+    "Installation instructions:\n"
+    "  macOS: brew install mpv\n"
+    "  Ubuntu/Debian: sudo apt-get install mpv\n"
+    "  Arch: sudo pacman -S mpv\n"
+    "  Raspberry Pi OS: sudo apt-get install mpv"
+)
+
+# Platform facts that cannot change while the process runs
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+_IS_ARM = "arm" in _MACHINE or "aarch" in _MACHINE
+# Device tree model file, only probed where it can identify a Raspberry Pi
+_HAS_RPI_MODEL = _IS_ARM and _SYSTEM == "linux" and os.path.lexists("/proc/device-tree/model")
 
 
 class SetupManager:
@@ -24,25 +43,66 @@ class SetupManager:
             config: Application configuration.
         """
         self.config = config
-        self.shutdown_handlers: list[Callable] = []
+        # Replaced rather than mutated, so the signal handler always iterates a stable snapshot
+        self.shutdown_handlers: tuple[Callable, ...] = ()
+        # Result of the PATH scan for MPV, looked up on first use
+        self._mpv_path: str | None = None
+        self._mpv_looked_up = False
+        # Outcome of the last check_requirements(), reused by get_system_info()
+        self._last_checks: dict[str, bool] | None = None
+        # Platform details never change while the process runs, detected on first use
+        self._platform_info: dict | None = None
+        self._logging_initialized = False
+        self._shutdown_requested = False
+        self._has_display: bool | None = None
+        # Media directory as a Path, resolved once configuration is validated
+        self._media_path: Path | None = None
+
+    def invalidate_cache(self) -> None:
+        """Forget cached lookups so the next checks see changes to the system."""
+        self._mpv_path = None
+        self._mpv_looked_up = False
+        self._last_checks = None
+        self._media_path = None
+
+    def _get_media_path(self) -> Path:
+        """Get the configured media directory as a Path, building it only once."""
+        if self._media_path is None:
+            self._media_path = Path(self.config.media_directory)
+        return self._media_path
+
+    def _find_mpv(self) -> str | None:
+        """Locate the MPV executable, scanning PATH only once.
 
-    def check_requirements(self) -> bool:
+        Returns:
+            Path to MPV, or None if it is not installed.
+        """
+        if not self._mpv_looked_up:
+            self._mpv_path = shutil.which("mpv")
+            self._mpv_looked_up = True
+        return self._mpv_path
+
+    def check_requirements(self, fast: bool = False) -> bool:
         """Check if all system requirements are met.
 
+        Args:
+            fast: Stop at the first failed check instead of reporting all of them.
+
         Returns:
             True if all requirements are satisfied.
         """
-        all_ok = True
-
         # Check MPV installation
-        if not self._check_mpv():
-            all_ok = False
+        mpv_ok = self._check_mpv()
+        if fast and not mpv_ok:
+            # The media directory was not checked, so there is nothing complete to reuse
+            self._last_checks = None
+            return False
 
         # Check media directory
-        if not self._check_media_directory():
-            all_ok = False
+        media_ok = self._check_media_directory()
 
-        return all_ok
+        self._last_checks = {"mpv_installed": mpv_ok, "media_directory_exists": media_ok}
+        return mpv_ok and media_ok
 
     def _check_mpv(self) -> bool:
         """Check if MPV is installed.
@@ -50,13 +110,8 @@ class SetupManager:
         Returns:
             True if MPV is available.
         """
-        if not shutil.which("mpv"):
-            logger.error("MPV is not installed!")
-            logger.error("Installation instructions:")
-            logger.error("  macOS: brew install mpv")
-            logger.error("  Ubuntu/Debian: sudo apt-get install mpv")
-            logger.error("  Arch: sudo pacman -S mpv")
-            logger.error("  Raspberry Pi OS: sudo apt-get install mpv")
+        if not self._find_mpv():
+            logger.error(_MPV_INSTALL_HELP)
             return False
 
         logger.debug("MPV is installed")
@@ -68,29 +123,36 @@ class SetupManager:
         Returns:
             True if media directory is ready.
         """
-        media_path = Path(self.config.media_directory)
+        media_path = self._get_media_path()
 
-        if not media_path.exists():
-            logger.warning(f"Media directory does not exist: {media_path}")
+        # A single stat answers both "does it exist" and "is it a directory"
+        try:
+            st = os.stat(media_path)
+        except FileNotFoundError:
+            logger.warning("Media directory does not exist: %s", media_path)
             try:
                 media_path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Created media directory: {media_path}")
+                logger.info("Created media directory: %s", media_path)
                 return True
-            except Exception as e:
-                logger.error(f"Failed to create media directory: {e}")
+            except Exception:
+                logger.exception("Failed to create media directory")
                 return False
+        except OSError as e:
+            logger.error("Cannot access media directory: %s", e)
+            return False
 
-        if not media_path.is_dir():
-            logger.error(f"Media path is not a directory: {media_path}")
+        if not stat.S_ISDIR(st.st_mode):
+            logger.error("Media path is not a directory: %s", media_path)
             return False
 
-        # Check if we can read the directory
+        # Check if we can read the directory; reading one entry is enough
         try:
-            list(media_path.iterdir())
-            logger.debug(f"Media directory is accessible: {media_path}")
+            with os.scandir(media_path) as entries:
+                next(entries, None)
+            logger.debug("Media directory is accessible: %s", media_path)
             return True
-        except Exception as e:
-            logger.error(f"Cannot access media directory: {e}")
+        except OSError as e:
+            logger.error("Cannot access media directory: %s", e)
             return False
 
     def detect_platform(self) -> dict:
@@ -99,27 +161,34 @@ class SetupManager:
         Returns:
             Dictionary with platform details.
         """
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        if self._platform_info is not None:
+            return dict(self._platform_info)
 
-        is_raspberry_pi = (
-            ("arm" in machine or "aarch" in machine) and system == "linux" and os.path.exists("/proc/device-tree/model")
-        )
-        has_display = bool(sys.stdout.isatty() or platform.system() == "Windows")
+        is_raspberry_pi = _HAS_RPI_MODEL
 
         info = {
-            "system": system,
-            "machine": machine,
+            "system": _SYSTEM,
+            "machine": _MACHINE,
             "platform": platform.platform(),
             "python_version": platform.python_version(),
             "is_raspberry_pi": is_raspberry_pi,
-            "has_display": has_display,
         }
 
-        logger.info(f"Platform detected: {system} on {machine}")
-        logger.debug(f"Platform details: {info}")
+        logger.info("Platform detected: %s on %s", _SYSTEM, _MACHINE)
+        logger.debug("Platform details: %s", info)
+
+        self._platform_info = info
+        return dict(info)
 
-        return info
+    @property
+    def has_display(self) -> bool:
+        """Whether a display is attached, checked on first access only.
+
+        Only system information reports this, so the startup path never pays for the isatty() probe.
+        """
+        if self._has_display is None:
+            self._has_display = bool(sys.stdout.isatty() or _SYSTEM == "windows")
+        return self._has_display
 
     def setup_signal_handlers(self, shutdown_callback: Callable | None = None) -> None:
         """Set up signal handlers for graceful shutdown.
@@ -129,45 +198,56 @@ class SetupManager:
         """
 
         def signal_handler(signum: int, frame: object) -> None:
-            logger.info(f"Received signal {signum}, initiating shutdown...")
+            logger.info("Received signal %s, initiating shutdown...", signum)
+            self._shutdown_requested = True
 
             # Call registered shutdown handlers
-            for handler in self.shutdown_handlers:
+            handlers = self.shutdown_handlers
+            for handler in handlers:
                 try:
                     handler()
-                except Exception as e:
-                    logger.error(f"Error in shutdown handler: {e}")
+                except Exception:
+                    logger.exception("Error in shutdown handler")
 
             # Call the main shutdown callback
             if shutdown_callback:
                 try:
                     shutdown_callback()
-                except Exception as e:
-                    logger.error(f"Error in shutdown callback: {e}")
+                except Exception:
+                    logger.exception("Error in shutdown callback")
 
-            sys.exit(0)
+            raise SystemExit(0)
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
         logger.debug("Signal handlers configured")
 
+    @property
+    def shutdown_requested(self) -> bool:
+        """Whether a shutdown signal has been received."""
+        return self._shutdown_requested
+
     def register_shutdown_handler(self, handler: Callable) -> None:
         """Register a handler to be called on shutdown.
 
         Args:
             handler: Callback function to execute on shutdown.
         """
-        self.shutdown_handlers.append(handler)
-        logger.debug(f"Registered shutdown handler: {handler.__name__}")
+        self.shutdown_handlers = (*self.shutdown_handlers, handler)
+        logger.debug("Registered shutdown handler: %s", handler.__name__)
 
     def initialize_logging(self) -> None:
         """Initialize and configure logging based on configuration."""
+        # Configuring again would only reinstall the same handlers
+        if self._logging_initialized:
+            return
         self.config.setup_logging()
+        self._logging_initialized = True
 
         # Set specific loggers if in test mode
         if self.config.test_mode:
-            logging.getLogger("signage").setLevel(logging.DEBUG)
+            _SIGNAGE_LOGGER.setLevel(logging.DEBUG)
             logger.info("Test mode enabled - verbose logging active")
 
     def validate_configuration(self) -> bool:
@@ -178,10 +258,11 @@ class SetupManager:
         """
         try:
             self.config.validate()
+            self._media_path = Path(self.config.media_directory)
             logger.debug("Configuration validated successfully")
             return True
         except ValueError as e:
-            logger.error(f"Configuration validation failed: {e}")
+            logger.error("Configuration validation failed: %s", e)
             return False
 
     def get_system_info(self) -> dict:
@@ -191,19 +272,23 @@ class SetupManager:
             Dictionary with system details.
         """
         platform_info = self.detect_platform()
+        requirements = self._last_checks
+        if requirements is None:
+            requirements = {
+                "mpv_installed": self._find_mpv() is not None,
+                "media_directory_exists": self._get_media_path().exists(),
+            }
 
         return {
             **platform_info,
+            "has_display": self.has_display,
             "config": {
                 "media_directory": self.config.media_directory,
                 "test_mode": self.config.test_mode,
                 "fullscreen": self.config.fullscreen,
                 "log_level": self.config.log_level,
             },
-            "requirements": {
-                "mpv_installed": shutil.which("mpv") is not None,
-                "media_directory_exists": Path(self.config.media_directory).exists(),
-            },
+            "requirements": dict(requirements),
         }
 
     def prepare_environment(self) -> bool:
@@ -222,14 +307,14 @@ class SetupManager:
             return False
 
         # Check all requirements
-        if not self.check_requirements():
+        if not self.check_requirements(fast=True):
             logger.error("System requirements not met")
             return False
 
         # Log system info
-        system_info = self.get_system_info()
-        logger.info(f"System: {system_info['system']} on {system_info['machine']}")
-        logger.info(f"Media directory: {self.config.media_directory}")
-        logger.info(f"Mode: {'Test' if self.config.test_mode else 'Production'}")
+        platform_info = self.detect_platform()
+        logger.info("System: %s on %s", platform_info["system"], platform_info["machine"])
+        logger.info("Media directory: %s", self._get_media_path())
+        logger.info("Mode: %s", "Test" if self.config.test_mode else "Production")
 
         return True